@@ -0,0 +1,71 @@
+"""On-disk cache for GitHub repo listings."""
+
+import json
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "github-org-mirror"
+
+# How long a cached org listing is considered fresh.
+CACHE_TTL_SECONDS = 300
+
+
+def _cache_file(org: str, cache_dir: Optional[Path] = None) -> Path:
+    """Get the cache file path for an organization."""
+    return (cache_dir or DEFAULT_CACHE_DIR) / f"{org}.json"
+
+
+def load_cached_repos(
+    org: str,
+    ttl: float = CACHE_TTL_SECONDS,
+    cache_dir: Optional[Path] = None,
+) -> Optional[List[dict]]:
+    """
+    Load a cached repo listing for an org.
+
+    Returns a list of Repository field dicts, or None if the cache is
+    missing, stale, or unreadable.
+    """
+    cache_file = _cache_file(org, cache_dir)
+    try:
+        with open(cache_file) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if time.time() - data.get("fetched_at", 0) > ttl:
+        return None
+
+    repos = data.get("repos")
+    if not isinstance(repos, list):
+        return None
+    return repos
+
+
+def store_cached_repos(org: str, repos: List, cache_dir: Optional[Path] = None) -> None:
+    """Store a repo listing for an org. Failures are silently ignored."""
+    cache_file = _cache_file(org, cache_dir)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fetched_at": time.time(),
+            "repos": [asdict(repo) for repo in repos],
+        }
+        with open(cache_file, "w") as f:
+            json.dump(payload, f)
+    except OSError:
+        pass
+
+
+def clear_cache(cache_dir: Optional[Path] = None) -> None:
+    """Remove all cached org listings."""
+    cache_path = cache_dir or DEFAULT_CACHE_DIR
+    if not cache_path.is_dir():
+        return
+    for entry in cache_path.glob("*.json"):
+        try:
+            entry.unlink()
+        except OSError:
+            pass
@@ -14,7 +14,8 @@ from .sync import get_sync_status, init_local_structure, sync_github_to_local
 from .utils import check_gh_auth, print_error, print_info, print_success, print_warning
 from .watcher import RepoWatcher
 
-console = Console()
+# highlight=False skips Rich's regex auto-highlighting on every string
+console = Console(highlight=False, soft_wrap=True)
 
 
 @click.group()
@@ -104,22 +105,21 @@ def init(
         # Full init with cloning
         result = init_local_structure(config)
 
-        # Print summary
-        console.print()
-        console.print("[bold]Initialization Complete[/bold]")
-        console.print(f"  Cloned: {len(result.cloned)} repos")
+        # Print summary in one write
+        lines = ["", "[bold]Initialization Complete[/bold]", f"  Cloned: {len(result.cloned)} repos"]
         if result.errors:
-            console.print(f"  Errors: {len(result.errors)}")
-            for error in result.errors:
-                print_error(f"    {error}")
+            lines.append(f"  Errors: {len(result.errors)}")
+            lines.extend(f"    [red]{error}[/red]" for error in result.errors)
+        console.print("\n".join(lines))
 
 
 @main.command()
 @click.option("--clone/--no-clone", default=True, help="Clone missing repos")
 @click.option("--move/--no-move", default=True, help="Move misplaced repos")
 @click.option("--dry-run", is_flag=True, help="Show what would be done without doing it")
+@click.option("--no-cache", is_flag=True, help="Force a fresh fetch of repo listings")
 @click.pass_context
-def sync(ctx: click.Context, clone: bool, move: bool, dry_run: bool) -> None:
+def sync(ctx: click.Context, clone: bool, move: bool, dry_run: bool, no_cache: bool) -> None:
     """Sync GitHub state to local folders."""
     config_path = ctx.obj.get("config_path")
 
@@ -141,16 +141,20 @@ def sync(ctx: click.Context, clone: bool, move: bool, dry_run: bool) -> None:
         clone_missing=clone,
         move_misplaced=move,
         dry_run=dry_run,
+        use_cache=not no_cache,
     )
 
-    # Print summary
-    console.print()
-    console.print("[bold]Sync Complete[/bold]")
-    console.print(f"  Cloned: {len(result.cloned)}")
-    console.print(f"  Moved: {len(result.moved)}")
-    console.print(f"  Orphaned: {len(result.orphaned)}")
+    # Print summary in one write
+    lines = [
+        "",
+        "[bold]Sync Complete[/bold]",
+        f"  Cloned: {len(result.cloned)}",
+        f"  Moved: {len(result.moved)}",
+        f"  Orphaned: {len(result.orphaned)}",
+    ]
     if result.errors:
-        console.print(f"  Errors: {len(result.errors)}")
+        lines.append(f"  Errors: {len(result.errors)}")
+    console.print("\n".join(lines))
 
 
 @main.command()
@@ -183,8 +187,9 @@ def watch(ctx: click.Context) -> None:
 
 @main.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed information")
+@click.option("--no-cache", is_flag=True, help="Force a fresh fetch of repo listings")
 @click.pass_context
-def status(ctx: click.Context, verbose: bool) -> None:
+def status(ctx: click.Context, verbose: bool, no_cache: bool) -> None:
     """Show current sync status."""
     config_path = ctx.obj.get("config_path")
 
@@ -197,7 +202,7 @@ def status(ctx: click.Context, verbose: bool) -> None:
         sys.exit(1)
 
     config = get_config(config_path)
-    status_info = get_sync_status(config)
+    status_info = get_sync_status(config, use_cache=not no_cache)
 
     # Summary table
     table = Table(title="Sync Status")
@@ -218,20 +223,25 @@ def status(ctx: click.Context, verbose: bool) -> None:
     if verbose and not status_info["in_sync"]:
         details = status_info["details"]
 
+        # Accumulate each section into one print; per-row console.print
+        # calls cost a full render and tty write apiece
         if details["misplaced"]:
-            console.print("\n[bold]Misplaced Repos:[/bold]")
-            for repo, from_org, to_org, _ in details["misplaced"]:
-                console.print(f"  {repo}: {from_org} -> should be in {to_org}")
+            lines = ["\n[bold]Misplaced Repos:[/bold]"]
+            lines.extend(
+                f"  {repo}: {from_org} -> should be in {to_org}"
+                for repo, from_org, to_org, _ in details["misplaced"]
+            )
+            console.print("\n".join(lines))
 
         if details["missing"]:
-            console.print("\n[bold]Missing Locally:[/bold]")
-            for org, repo, _ in details["missing"]:
-                console.print(f"  {org}/{repo}")
+            lines = ["\n[bold]Missing Locally:[/bold]"]
+            lines.extend(f"  {org}/{repo}" for org, repo, _ in details["missing"])
+            console.print("\n".join(lines))
 
         if details["orphaned"]:
-            console.print("\n[bold]Orphaned (not on GitHub):[/bold]")
-            for org, repo, _ in details["orphaned"]:
-                console.print(f"  {org}/{repo}")
+            lines = ["\n[bold]Orphaned (not on GitHub):[/bold]"]
+            lines.extend(f"  {org}/{repo}" for org, repo, _ in details["orphaned"])
+            console.print("\n".join(lines))
 
 
 @main.command("config")
@@ -287,9 +297,9 @@ def config_cmd(
     console.print(table)
 
     if config.organizations:
-        console.print("\n[bold]Organizations:[/bold]")
-        for org in config.organizations:
-            console.print(f"  - {org}")
+        lines = ["\n[bold]Organizations:[/bold]"]
+        lines.extend(f"  - {org}" for org in config.organizations)
+        console.print("\n".join(lines))
 
 
 if __name__ == "__main__":
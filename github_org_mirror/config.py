@@ -2,13 +2,23 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "github-org-mirror"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.yaml"
 
+# Parsed configs keyed by path, invalidated by file mtime. Long-lived
+# processes (the watcher) and repeated loads within one invocation skip
+# re-parsing YAML when the file has not changed.
+_CACHE: Dict[Path, Tuple[int, "Config"]] = {}
+
 
 class Config:
     """Configuration handler for github-org-mirror."""
@@ -21,13 +31,30 @@ class Config:
         exclude_repos: Optional[List[str]] = None,
         auto_update_remotes: bool = True,
         clone_protocol: str = "ssh",
+        clone_concurrency: int = 8,
+        shallow_clone: bool = True,
+        max_transfer_workers: int = 8,
     ):
         self.base_path = Path(base_path).expanduser().resolve()
+        self._base_str = str(self.base_path)
         self.organizations = organizations or []
         self.sync_interval = sync_interval
         self.exclude_repos = exclude_repos or [".github"]
+        # List is kept for YAML serialization; the frozenset serves O(1)
+        # membership tests in per-repo loops.
+        self._exclude_set = frozenset(self.exclude_repos)
         self.auto_update_remotes = auto_update_remotes
         self.clone_protocol = clone_protocol  # 'ssh' or 'https'
+        # Protocol is fixed for the lifetime of the config, so bind the
+        # URL template once instead of branching per call.
+        self._url_template = (
+            "git@github.com:{}/{}.git"
+            if clone_protocol == "ssh"
+            else "https://github.com/{}/{}.git"
+        )
+        self.clone_concurrency = clone_concurrency
+        self.shallow_clone = shallow_clone
+        self.max_transfer_workers = max_transfer_workers
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for serialization."""
@@ -38,6 +65,9 @@ class Config:
             "exclude_repos": self.exclude_repos,
             "auto_update_remotes": self.auto_update_remotes,
             "clone_protocol": self.clone_protocol,
+            "clone_concurrency": self.clone_concurrency,
+            "shallow_clone": self.shallow_clone,
+            "max_transfer_workers": self.max_transfer_workers,
         }
 
     @classmethod
@@ -50,6 +80,9 @@ class Config:
             exclude_repos=data.get("exclude_repos", [".github"]),
             auto_update_remotes=data.get("auto_update_remotes", True),
             clone_protocol=data.get("clone_protocol", "ssh"),
+            clone_concurrency=data.get("clone_concurrency", 8),
+            shallow_clone=data.get("shallow_clone", True),
+            max_transfer_workers=data.get("max_transfer_workers", 8),
         )
 
     def save(self, path: Optional[Path] = None) -> None:
@@ -58,24 +91,50 @@ class Config:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w") as f:
             yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+        _CACHE.pop(config_path, None)
 
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "Config":
         """Load configuration from YAML file."""
         config_path = path or DEFAULT_CONFIG_FILE
-        if not config_path.exists():
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
             return cls()
+
+        cached = _CACHE.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
-        return cls.from_dict(data)
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        config = cls.from_dict(data)
+        _CACHE[config_path] = (mtime_ns, config)
+        return config
 
     def get_org_path(self, org: str) -> Path:
         """Get the local path for an organization."""
-        return self.base_path / org
+        return Path(self.get_org_path_str(org))
 
     def get_repo_path(self, org: str, repo: str) -> Path:
         """Get the local path for a repository."""
-        return self.base_path / org / repo
+        return Path(self.get_repo_path_str(org, repo))
+
+    def url_for(self, owner: str, repo: str) -> str:
+        """Build the clone URL for a repo using the configured protocol."""
+        return self._url_template.format(owner, repo)
+
+    def get_org_path_str(self, org: str) -> str:
+        """Get the local path for an organization as a plain string.
+
+        Cheaper than get_org_path in loops that only pass the path on
+        to os-level calls.
+        """
+        return os.path.join(self._base_str, org)
+
+    def get_repo_path_str(self, org: str, repo: str) -> str:
+        """Get the local path for a repository as a plain string."""
+        return os.path.join(self._base_str, org, repo)
 
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors."""
@@ -86,6 +145,8 @@ class Config:
             errors.append("Sync interval should be at least 60 seconds")
         if self.clone_protocol not in ("ssh", "https"):
             errors.append("Clone protocol must be 'ssh' or 'https'")
+        if self.clone_concurrency < 1:
+            errors.append("Clone concurrency must be at least 1")
         return errors
 
 
@@ -0,0 +1,128 @@
+"""Direct GitHub API access over a pooled HTTP client.
+
+Spawning the gh binary costs ~50-100ms of process startup plus a TLS
+handshake per call. When httpx is installed, requests go over one
+keep-alive connection instead; callers fall back to gh when it is not.
+"""
+
+import functools
+import subprocess
+import time
+from typing import Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+API_BASE_URL = "https://api.github.com"
+
+
+@functools.lru_cache(maxsize=1)
+def get_auth_token() -> Optional[str]:
+    """Read the GitHub token from gh, once per process."""
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+class GitHubClient:
+    """Thin wrapper around a pooled httpx client for the GitHub API."""
+
+    def __init__(self, token: str):
+        kwargs = dict(
+            base_url=API_BASE_URL,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=30.0,
+        )
+        try:
+            # HTTP/2 multiplexes concurrent requests on one connection,
+            # but needs the optional h2 package.
+            self._client = httpx.Client(http2=True, **kwargs)
+        except ImportError:
+            self._client = httpx.Client(**kwargs)
+
+    def get(self, path: str) -> Optional["httpx.Response"]:
+        """Issue a GET request against the REST API, or None on transport failure."""
+        try:
+            return self._client.get(path)
+        except httpx.HTTPError:
+            return None
+
+    def post(self, path: str, json: Optional[dict] = None) -> Optional["httpx.Response"]:
+        """Issue a POST request against the REST API, or None on transport failure."""
+        try:
+            return self._client.post(path, json=json)
+        except httpx.HTTPError:
+            return None
+
+    def graphql(self, query: str, variables: Optional[dict] = None) -> Optional[dict]:
+        """
+        Run a GraphQL query and return the decoded response body.
+
+        Returns None on transport failure; GraphQL-level errors are left
+        in the body for the caller to inspect.
+        """
+        try:
+            response = self._client.post(
+                "/graphql",
+                json={"query": query, "variables": variables or {}},
+            )
+            return response.json()
+        except (httpx.HTTPError, ValueError):
+            return None
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._client.close()
+
+
+_AUTH_CHECK_TTL = 60.0
+_auth_check: Optional[Tuple[float, bool]] = None
+
+
+def check_auth() -> Optional[bool]:
+    """
+    Check GitHub authentication via the pooled client, memoized for 60s.
+
+    Returns None when direct API access is unavailable, in which case
+    callers should fall back to gh.
+    """
+    global _auth_check
+    client = get_client()
+    if client is None:
+        return None
+
+    now = time.monotonic()
+    if _auth_check is not None and now - _auth_check[0] < _AUTH_CHECK_TTL:
+        return _auth_check[1]
+
+    response = client.get("/user")
+    ok = response is not None and response.status_code == 200
+    _auth_check = (now, ok)
+    return ok
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> Optional[GitHubClient]:
+    """
+    Get the process-wide GitHubClient, or None if direct API access is
+    unavailable (httpx not installed, or no gh auth token).
+    """
+    if httpx is None:
+        return None
+    token = get_auth_token()
+    if not token:
+        return None
+    return GitHubClient(token)
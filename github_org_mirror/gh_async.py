@@ -0,0 +1,86 @@
+"""Bulk GitHub API access over an async HTTP client.
+
+The blocking helpers in gh_api issue one request at a time; an initial
+reconciliation across hundreds of repos wants them all in flight
+together. httpx.AsyncClient pipelines the requests over a pooled
+connection (multiplexed when HTTP/2 is available), with a semaphore
+capping how many run at once.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .gh_api import API_BASE_URL, get_auth_token
+
+MAX_CONCURRENT_REQUESTS = 10
+
+
+async def fetch_repos(
+    pairs: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Optional[dict]]:
+    """
+    Fetch repository metadata for many (owner, repo) pairs concurrently.
+
+    Maps each pair to the decoded GET /repos/{owner}/{repo} body, or
+    None for repos that could not be fetched (missing, moved, transport
+    error). Raises RuntimeError when direct API access is unavailable;
+    use fetch_repos_sync from blocking code to get the fallback-friendly
+    contract instead.
+    """
+    token = get_auth_token()
+    if httpx is None or not token:
+        raise RuntimeError("Direct GitHub API access is unavailable")
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    kwargs = dict(
+        base_url=API_BASE_URL,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        },
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+    try:
+        client = httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        client = httpx.AsyncClient(**kwargs)
+
+    async def fetch_one(owner: str, repo: str) -> Optional[dict]:
+        async with sem:
+            try:
+                response = await client.get(f"/repos/{owner}/{repo}")
+            except httpx.HTTPError:
+                return None
+        if response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    async with client:
+        results = await asyncio.gather(
+            *(fetch_one(owner, repo) for owner, repo in pairs)
+        )
+    return dict(zip(pairs, results))
+
+
+def fetch_repos_sync(
+    pairs: List[Tuple[str, str]],
+) -> Optional[Dict[Tuple[str, str], Optional[dict]]]:
+    """
+    Blocking wrapper around fetch_repos.
+
+    Returns None when direct API access is unavailable (httpx not
+    installed, or no gh auth token), in which case callers should fall
+    back to per-repo gh calls.
+    """
+    if httpx is None or not get_auth_token():
+        return None
+    return asyncio.run(fetch_repos(pairs))
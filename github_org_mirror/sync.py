@@ -1,6 +1,11 @@
 """GitHub to local sync operations."""
 
+import errno
+import os
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
@@ -11,14 +16,12 @@ from .config import Config
 from .transfer import Repository, clone_repo, list_org_repos
 from .utils import (
     get_repo_remote_url,
-    is_git_repo,
     parse_github_remote,
     print_error,
     print_info,
     print_success,
     print_warning,
     set_repo_remote_url,
-    build_github_url,
 )
 
 
@@ -32,6 +35,12 @@ class SyncResult:
     errors: List[str]
 
 
+# Per-org scan results keyed by the org directory's mtime. Adding,
+# removing, or renaming a direct child bumps the parent mtime, so an
+# unchanged mtime means the previous scan is still valid.
+_local_scan_cache: Dict[str, Tuple[int, Dict[str, Path]]] = {}
+
+
 def get_local_repos(config: Config) -> Dict[str, Dict[str, Path]]:
     """
     Get all local repositories organized by org.
@@ -41,20 +50,42 @@ def get_local_repos(config: Config) -> Dict[str, Dict[str, Path]]:
     result: Dict[str, Dict[str, Path]] = {}
 
     for org in config.organizations:
-        org_path = config.get_org_path(org)
+        org_path = config.get_org_path_str(org)
         result[org] = {}
 
-        if not org_path.exists():
+        try:
+            dir_mtime = os.stat(org_path).st_mtime_ns
+            cached = _local_scan_cache.get(org_path)
+            if cached is not None and cached[0] == dir_mtime:
+                result[org] = cached[1]
+                continue
+            entries = os.scandir(org_path)
+        except OSError:
             continue
 
-        for item in org_path.iterdir():
-            if item.is_dir() and is_git_repo(item):
-                result[org][item.name] = item
+        # DirEntry.is_dir reuses the stat info from scandir, so each repo
+        # costs one extra syscall (the .git check) instead of several.
+        # os.path.exists accepts both .git directories and the .git files
+        # used by worktrees and submodules.
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and os.path.exists(
+                    os.path.join(entry.path, ".git")
+                ):
+                    result[org][entry.name] = Path(entry.path)
+
+        _local_scan_cache[org_path] = (dir_mtime, result[org])
 
     return result
 
 
-def get_github_repos(config: Config) -> Dict[str, Dict[str, Repository]]:
+# In-process memo so commands that fetch the GitHub state twice in one
+# invocation (e.g. init, which syncs right after) hit the network once.
+_REPOS_MEMO_TTL = 60.0
+_repos_memo: Dict[Tuple[str, ...], Tuple[float, Dict[str, Dict[str, Repository]]]] = {}
+
+
+def get_github_repos(config: Config, use_cache: bool = True) -> Dict[str, Dict[str, Repository]]:
     """
     Get all GitHub repositories organized by org.
 
@@ -62,28 +93,65 @@ def get_github_repos(config: Config) -> Dict[str, Dict[str, Repository]]:
     """
     result: Dict[str, Dict[str, Repository]] = {}
 
+    if not config.organizations:
+        return result
+
+    memo_key = tuple(config.organizations)
+    if use_cache:
+        memo = _repos_memo.get(memo_key)
+        if memo is not None and time.monotonic() - memo[0] < _REPOS_MEMO_TTL:
+            return memo[1]
+
+    # Listing repos is one network round-trip per org, so fetch orgs
+    # concurrently instead of paying N round-trips back to back.
+    progress_lock = threading.Lock()
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
     ) as progress:
-        for org in config.organizations:
-            task = progress.add_task(f"Fetching repos for {org}...", total=None)
-            repos = list_org_repos(org)
-            result[org] = {}
 
-            for repo in repos:
-                if repo.name not in config.exclude_repos:
-                    result[org][repo.name] = repo
+        def fetch_org(org: str) -> Tuple[str, List[Repository]]:
+            with progress_lock:
+                task = progress.add_task(f"Fetching repos for {org}...", total=None)
+            try:
+                return org, list_org_repos(org, use_cache=use_cache)
+            finally:
+                with progress_lock:
+                    progress.remove_task(task)
+
+        max_workers = min(8, len(config.organizations))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for org, repos in executor.map(fetch_org, config.organizations):
+                result[org] = {}
+                for repo in repos:
+                    if repo.name not in config._exclude_set:
+                        result[org][repo.name] = repo
+
+    _repos_memo[memo_key] = (time.monotonic(), result)
+    return result
+
 
-            progress.remove_task(task)
+def build_github_indexes(
+    github_repos: Dict[str, Dict[str, Repository]],
+) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Build lookup indexes over the GitHub repo map in a single pass.
 
-    return result
+    Returns: (repo_name -> org, set of all repo names)
+    """
+    locations: Dict[str, str] = {}
+    for org, repos in github_repos.items():
+        for repo_name in repos:
+            locations[repo_name] = org
+    return locations, set(locations)
 
 
 def find_misplaced_repos(
     local_repos: Dict[str, Dict[str, Path]],
     github_repos: Dict[str, Dict[str, Repository]],
+    github_locations: Optional[Dict[str, str]] = None,
 ) -> List[Tuple[str, str, str, Path]]:
     """
     Find repos that are in the wrong local org folder.
@@ -93,10 +161,8 @@ def find_misplaced_repos(
     misplaced = []
 
     # Build a map of where each repo should be according to GitHub
-    github_locations: Dict[str, str] = {}
-    for org, repos in github_repos.items():
-        for repo_name in repos:
-            github_locations[repo_name] = org
+    if github_locations is None:
+        github_locations = build_github_indexes(github_repos)[0]
 
     # Check local repos against GitHub locations
     for local_org, repos in local_repos.items():
@@ -132,6 +198,7 @@ def find_missing_repos(
 def find_orphaned_repos(
     local_repos: Dict[str, Dict[str, Path]],
     github_repos: Dict[str, Dict[str, Repository]],
+    github_repo_names: Optional[Set[str]] = None,
 ) -> List[Tuple[str, str, Path]]:
     """
     Find repos that exist locally but not on GitHub.
@@ -141,9 +208,8 @@ def find_orphaned_repos(
     orphaned = []
 
     # Build set of all GitHub repos
-    github_repo_names: Set[str] = set()
-    for repos in github_repos.values():
-        github_repo_names.update(repos.keys())
+    if github_repo_names is None:
+        github_repo_names = build_github_indexes(github_repos)[1]
 
     for org, repos in local_repos.items():
         for repo_name, path in repos.items():
@@ -158,6 +224,8 @@ def sync_github_to_local(
     clone_missing: bool = True,
     move_misplaced: bool = True,
     dry_run: bool = False,
+    use_cache: bool = True,
+    github_repos: Optional[Dict[str, Dict[str, Repository]]] = None,
 ) -> SyncResult:
     """
     Sync GitHub state to local folders.
@@ -167,6 +235,8 @@ def sync_github_to_local(
         clone_missing: Whether to clone repos that exist on GitHub but not locally
         move_misplaced: Whether to move repos to correct org folders
         dry_run: If True, only report what would be done
+        use_cache: Whether cached repo listings may be used
+        github_repos: Pre-fetched GitHub state, if the caller already has it
 
     Returns: SyncResult with details of operations performed
     """
@@ -174,7 +244,9 @@ def sync_github_to_local(
 
     print_info("Fetching repository information...")
     local_repos = get_local_repos(config)
-    github_repos = get_github_repos(config)
+    if github_repos is None:
+        github_repos = get_github_repos(config, use_cache=use_cache)
+    github_locations, github_repo_names = build_github_indexes(github_repos)
 
     # Ensure org directories exist
     if not dry_run:
@@ -184,7 +256,7 @@ def sync_github_to_local(
 
     # Handle misplaced repos
     if move_misplaced:
-        misplaced = find_misplaced_repos(local_repos, github_repos)
+        misplaced = find_misplaced_repos(local_repos, github_repos, github_locations)
         for repo_name, from_org, to_org, current_path in misplaced:
             if dry_run:
                 print_info(f"Would move {repo_name}: {from_org} -> {to_org}")
@@ -193,12 +265,20 @@ def sync_github_to_local(
                 new_path = config.get_repo_path(to_org, repo_name)
                 try:
                     print_info(f"Moving {repo_name}: {from_org} -> {to_org}")
-                    shutil.move(str(current_path), str(new_path))
+                    new_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        # Same-filesystem rename is O(1) regardless of
+                        # repo size; only fall back to a copying move
+                        # when crossing devices.
+                        os.rename(current_path, new_path)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(str(current_path), str(new_path))
 
                     # Update remote URL
                     if config.auto_update_remotes:
-                        new_url = build_github_url(to_org, repo_name, config.clone_protocol)
-                        set_repo_remote_url(new_path, new_url)
+                        set_repo_remote_url(new_path, config.url_for(to_org, repo_name))
 
                     result.moved.append((repo_name, from_org, to_org))
                     print_success(f"Moved {repo_name} to {to_org}")
@@ -210,23 +290,42 @@ def sync_github_to_local(
     # Handle missing repos
     if clone_missing:
         missing = find_missing_repos(local_repos, github_repos)
-        for org, repo_name, repo in missing:
-            dest_path = config.get_repo_path(org, repo_name)
-            if dry_run:
+        if dry_run:
+            for org, repo_name, repo in missing:
                 print_info(f"Would clone {org}/{repo_name}")
                 result.cloned.append(f"{org}/{repo_name}")
-            else:
-                if clone_repo(org, repo_name, str(dest_path), config.clone_protocol):
-                    result.cloned.append(f"{org}/{repo_name}")
-                else:
-                    result.errors.append(f"Failed to clone {org}/{repo_name}")
+        elif missing:
+            # Clones are network-bound, so run several at once. Results are
+            # appended under a lock since workers finish in arbitrary order.
+            result_lock = threading.Lock()
+
+            def do_clone(item: Tuple[str, str, Repository]) -> None:
+                org, repo_name, _ = item
+                ok = clone_repo(
+                    org,
+                    repo_name,
+                    config.get_repo_path_str(org, repo_name),
+                    config.clone_protocol,
+                    shallow=config.shallow_clone,
+                )
+                with result_lock:
+                    if ok:
+                        result.cloned.append(f"{org}/{repo_name}")
+                    else:
+                        result.errors.append(f"Failed to clone {org}/{repo_name}")
+
+            max_workers = min(config.clone_concurrency, len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(do_clone, missing))
 
     # Find orphaned repos (just report, don't delete)
-    orphaned = find_orphaned_repos(local_repos, github_repos)
-    for org, repo_name, path in orphaned:
-        result.orphaned.append(f"{org}/{repo_name}")
-        if orphaned:
-            print_warning(f"Orphaned repo (not on GitHub): {org}/{repo_name}")
+    orphaned = find_orphaned_repos(local_repos, github_repos, github_repo_names)
+    if orphaned:
+        result.orphaned.extend(f"{org}/{repo_name}" for org, repo_name, _ in orphaned)
+        # One print for the whole batch; Rich's per-call overhead adds up
+        print_warning(
+            "\n".join(f"Orphaned repo (not on GitHub): {name}" for name in result.orphaned)
+        )
 
     return result
 
@@ -257,18 +356,19 @@ def init_local_structure(config: Config) -> SyncResult:
     )
 
 
-def get_sync_status(config: Config) -> Dict:
+def get_sync_status(config: Config, use_cache: bool = True) -> Dict:
     """
     Get current sync status.
 
     Returns a dict with sync state information.
     """
     local_repos = get_local_repos(config)
-    github_repos = get_github_repos(config)
+    github_repos = get_github_repos(config, use_cache=use_cache)
+    github_locations, github_repo_names = build_github_indexes(github_repos)
 
-    misplaced = find_misplaced_repos(local_repos, github_repos)
+    misplaced = find_misplaced_repos(local_repos, github_repos, github_locations)
     missing = find_missing_repos(local_repos, github_repos)
-    orphaned = find_orphaned_repos(local_repos, github_repos)
+    orphaned = find_orphaned_repos(local_repos, github_repos, github_repo_names)
 
     local_count = sum(len(repos) for repos in local_repos.values())
     github_count = sum(len(repos) for repos in github_repos.values())
@@ -1,11 +1,23 @@
 """GitHub repository transfer operations."""
 
 import json
+import os
+import random
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from .cache import load_cached_repos, store_cached_repos
+from .gh_api import get_client
 from .utils import (
     build_github_url,
     print_error,
@@ -16,10 +28,23 @@ from .utils import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class Repository:
     """Represents a GitHub repository."""
 
+    # Manual __slots__ rather than @dataclass(slots=True), which needs
+    # Python 3.10; cuts per-instance memory roughly in half for large orgs.
+    __slots__ = (
+        "name",
+        "owner",
+        "full_name",
+        "clone_url",
+        "ssh_url",
+        "is_private",
+        "is_archived",
+        "default_branch",
+    )
+
     name: str
     owner: str
     full_name: str
@@ -30,49 +55,118 @@ class Repository:
     default_branch: str
 
 
-def list_org_repos(org: str) -> List[Repository]:
-    """List all repositories for an organization."""
-    result = run_gh_command(
-        [
-            "repo",
-            "list",
-            org,
-            "--limit",
-            "500",
-            "--json",
-            "name,owner,nameWithOwner,url,sshUrl,isPrivate,isArchived,defaultBranchRef",
-        ]
-    )
+# Tuning for spawned git processes: protocol v2 trims ref negotiation
+# on fetch, thread counts of 0 mean "use all cores", fetch.parallel=0
+# auto-parallelizes submodule fetches.
+_GIT_CONFIG_PARAMETERS = (
+    "'protocol.version=2' 'pack.threads=0' 'index.threads=0' 'fetch.parallel=0'"
+)
 
-    if result.returncode != 0:
-        print_error(f"Failed to list repos for {org}: {result.stderr}")
-        return []
+
+def _git_env() -> dict:
+    """Environment for git subprocesses with performance tuning applied."""
+    return {**os.environ, "GIT_CONFIG_PARAMETERS": _GIT_CONFIG_PARAMETERS}
+
+
+_LIST_REPOS_QUERY = """
+query($org: String!, $cursor: String) {
+  organization(login: $org) {
+    repositories(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        owner { login }
+        nameWithOwner
+        url
+        sshUrl
+        isPrivate
+        isArchived
+        defaultBranchRef { name }
+      }
+    }
+  }
+}
+"""
+
+
+def _graphql(query: str, variables: Optional[dict] = None) -> Optional[dict]:
+    """
+    Run a GraphQL query and return the decoded response body.
+
+    Prefers the pooled HTTP client; falls back to spawning gh when
+    direct API access is unavailable.
+    """
+    client = get_client()
+    if client is not None:
+        return client.graphql(query, variables)
+
+    args = ["api", "graphql"]
+    for key, value in (variables or {}).items():
+        if value is not None:
+            args += ["-F", f"{key}={value}"]
+    args += ["-f", f"query={query}"]
+    result = run_gh_command(args)
 
     try:
-        repos_data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        print_error(f"Failed to parse repo list for {org}")
-        return []
-
-    repos = []
-    for repo in repos_data:
-        default_branch = "main"
-        if repo.get("defaultBranchRef"):
-            default_branch = repo["defaultBranchRef"].get("name", "main")
-
-        repos.append(
-            Repository(
-                name=repo["name"],
-                owner=repo["owner"]["login"],
-                full_name=repo["nameWithOwner"],
-                clone_url=repo["url"] + ".git",
-                ssh_url=repo.get("sshUrl", f"git@github.com:{repo['nameWithOwner']}.git"),
-                is_private=repo.get("isPrivate", False),
-                is_archived=repo.get("isArchived", False),
-                default_branch=default_branch,
-            )
-        )
+        return _json_loads(result.stdout)
+    except ValueError:
+        return None
+
 
+def _repo_from_node(node: dict) -> Repository:
+    """Build a Repository from a GraphQL repository node."""
+    default_branch = "main"
+    if node.get("defaultBranchRef"):
+        default_branch = node["defaultBranchRef"].get("name", "main")
+
+    return Repository(
+        name=node["name"],
+        owner=node["owner"]["login"],
+        full_name=node["nameWithOwner"],
+        clone_url=node["url"] + ".git",
+        ssh_url=node.get("sshUrl", f"git@github.com:{node['nameWithOwner']}.git"),
+        is_private=node.get("isPrivate", False),
+        is_archived=node.get("isArchived", False),
+        default_branch=default_branch,
+    )
+
+
+def list_org_repos(org: str, use_cache: bool = True) -> List[Repository]:
+    """List all repositories for an organization.
+
+    Uses the GraphQL API with cursor pagination so orgs with more than
+    the old ``gh repo list --limit 500`` cap are listed completely.
+    Results are cached on disk for a short TTL; pass use_cache=False to
+    force a fresh fetch.
+    """
+    if use_cache:
+        cached = load_cached_repos(org)
+        if cached is not None:
+            try:
+                return [Repository(**fields) for fields in cached]
+            except TypeError:
+                pass  # Stale cache from an older Repository shape
+
+    repos: List[Repository] = []
+    cursor: Optional[str] = None
+
+    while True:
+        data = _graphql(_LIST_REPOS_QUERY, {"org": org, "cursor": cursor})
+
+        try:
+            connection = data["data"]["organization"]["repositories"]
+        except (KeyError, TypeError):
+            print_error(f"Failed to list repos for {org}")
+            return []
+
+        repos.extend(_repo_from_node(node) for node in connection["nodes"])
+
+        page_info = connection["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
+
+    store_cached_repos(org, repos)
     return repos
 
 
@@ -85,19 +179,26 @@ def transfer_repo(owner: str, repo: str, new_owner: str) -> bool:
     print_info(f"Transferring {owner}/{repo} to {new_owner}...")
 
     # Use GitHub API to initiate transfer
-    result = run_gh_command(
-        [
-            "api",
-            f"/repos/{owner}/{repo}/transfer",
-            "-X",
-            "POST",
-            "-f",
-            f"new_owner={new_owner}",
-        ]
-    )
-
-    if result.returncode != 0:
+    client = get_client()
+    if client is not None:
+        response = client.post(f"/repos/{owner}/{repo}/transfer", json={"new_owner": new_owner})
+        ok = response is not None and response.status_code in (200, 202)
+        error_msg = "request failed" if response is None else ("" if ok else response.text)
+    else:
+        result = run_gh_command(
+            [
+                "api",
+                f"/repos/{owner}/{repo}/transfer",
+                "-X",
+                "POST",
+                "-f",
+                f"new_owner={new_owner}",
+            ]
+        )
+        ok = result.returncode == 0
         error_msg = result.stderr
+
+    if not ok:
         if "transfer is already pending" in error_msg.lower():
             print_warning(f"Transfer already pending for {repo}")
             return True
@@ -111,39 +212,171 @@ def transfer_repo(owner: str, repo: str, new_owner: str) -> bool:
     return True
 
 
+def check_repos_exist(repos: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    """
+    Check which of the given (owner, repo) pairs exist on GitHub.
+
+    Batches all lookups into a single aliased GraphQL query, so checking
+    N pending transfers costs one API round-trip instead of N.
+    """
+    if not repos:
+        return set()
+
+    fields = " ".join(
+        f'r{i}: repository(owner: "{owner}", name: "{name}") {{ id }}'
+        for i, (owner, name) in enumerate(repos)
+    )
+    # Missing repos come back as GraphQL errors, but the data section
+    # still reports the ones that do exist.
+    body = _graphql(f"{{ {fields} }}")
+    data = (body or {}).get("data") or {}
+
+    return {pair for i, pair in enumerate(repos) if data.get(f"r{i}")}
+
+
 def wait_for_transfer(new_owner: str, repo: str, timeout: int = 60) -> bool:
-    """Wait for a repository transfer to complete."""
+    """
+    Wait for a repository transfer to complete.
+
+    Polling is the best a CLI can do here; true event-driven waiting
+    would need a repository webhook subscription.
+    """
     print_info(f"Waiting for transfer to complete...")
 
     start_time = time.time()
+    attempt = 0
     while time.time() - start_time < timeout:
         # Check if repo exists in new location
-        result = run_gh_command(["repo", "view", f"{new_owner}/{repo}", "--json", "name"])
-
-        if result.returncode == 0:
+        if check_repos_exist([(new_owner, repo)]):
             print_success(f"Transfer complete: {new_owner}/{repo}")
             return True
 
-        time.sleep(2)
+        # Exponential backoff with jitter: catch fast transfers quickly,
+        # then poll sparsely (and desynchronized from parallel waiters)
+        # for the slow ones.
+        time.sleep(min(16.0, 0.5 * 2**attempt) + random.uniform(0, 0.5))
+        attempt += 1
 
     print_warning(f"Transfer not complete within {timeout}s. It may still be processing.")
     return False
 
 
+class TransferTracker:
+    """
+    Polls all pending repo transfers as a single batch.
+
+    Each tracked (owner, repo) gets a threading.Event that is set once
+    the repo appears under its new owner. However many transfers are in
+    flight, one background thread issues one batched check_repos_exist
+    call per tick, instead of every waiter polling on its own.
+    """
+
+    def __init__(self, poll_interval: float = 5.0):
+        self.poll_interval = poll_interval
+        self._pending: dict = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, owner: str, repo: str) -> threading.Event:
+        """Register a pending transfer and return its completion event."""
+        key = (owner, repo)
+        with self._lock:
+            event = self._pending.get(key)
+            if event is None:
+                event = threading.Event()
+                self._pending[key] = event
+            # _thread is None exactly when no loop is (or will keep)
+            # polling — the loop clears it under _lock as it decides to
+            # exit, so this check cannot race a thread that is already
+            # on its way out
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll_loop,
+                    name="transfer-tracker",
+                    daemon=True,
+                )
+                self._thread.start()
+        return event
+
+    def untrack(self, owner: str, repo: str) -> None:
+        """Stop tracking a transfer (e.g. after a waiter times out)."""
+        with self._lock:
+            self._pending.pop((owner, repo), None)
+
+    def _poll_loop(self) -> None:
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                pending = list(self._pending)
+                if not pending:
+                    # Exit handshake: clearing _thread in the same
+                    # locked section tells track() to start a fresh loop
+                    self._thread = None
+                    return
+            completed = check_repos_exist(pending)
+            with self._lock:
+                for key in completed:
+                    event = self._pending.pop(key, None)
+                    if event is not None:
+                        event.set()
+                if not self._pending:
+                    self._thread = None
+                    return
+
+
+_tracker = TransferTracker()
+
+
+def wait_for_transfer_tracked(new_owner: str, repo: str, timeout: int = 120) -> bool:
+    """
+    Wait for a transfer via the shared tracker.
+
+    Unlike wait_for_transfer, concurrent waiters share one poll loop and
+    one API call per tick.
+    """
+    print_info(f"Waiting for transfer to complete...")
+
+    if _tracker.track(new_owner, repo).wait(timeout):
+        print_success(f"Transfer complete: {new_owner}/{repo}")
+        return True
+
+    _tracker.untrack(new_owner, repo)
+    print_warning(f"Transfer not complete within {timeout}s. It may still be processing.")
+    return False
+
+
 def clone_repo(
     owner: str,
     repo: str,
     dest_path: str,
     protocol: str = "ssh",
+    shallow: bool = True,
 ) -> bool:
-    """Clone a repository to a local path."""
+    """
+    Clone a repository to a local path.
+
+    By default this is a shallow, blobless, single-branch clone —
+    history and old blobs are fetched on demand, which is a fraction of
+    the bandwidth and disk of a full clone. Pass shallow=False for a
+    full clone.
+    """
     url = build_github_url(owner, repo, protocol)
 
-    result = subprocess.run(
-        ["git", "clone", url, dest_path],
-        capture_output=True,
-        text=True,
-    )
+    args = ["git", "clone"]
+    if shallow:
+        args += ["--filter=blob:none", "--depth=1", "--single-branch"]
+    args += [url, dest_path]
+
+    result = subprocess.run(args, capture_output=True, text=True, env=_git_env())
+
+    if result.returncode != 0 and shallow and "filter" in result.stderr.lower():
+        # Remote does not support partial clone; retry in full
+        result = subprocess.run(
+            ["git", "clone", url, dest_path],
+            capture_output=True,
+            text=True,
+            env=_git_env(),
+        )
 
     if result.returncode != 0:
         # Check if it's just because the directory exists
@@ -159,6 +392,26 @@ def clone_repo(
 
 def get_repo_info(owner: str, repo: str) -> Optional[Repository]:
     """Get information about a specific repository."""
+    client = get_client()
+    if client is not None:
+        response = client.get(f"/repos/{owner}/{repo}")
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            data = response.json()
+            return Repository(
+                name=data["name"],
+                owner=data["owner"]["login"],
+                full_name=data["full_name"],
+                clone_url=data["clone_url"],
+                ssh_url=data["ssh_url"],
+                is_private=data.get("private", False),
+                is_archived=data.get("archived", False),
+                default_branch=data.get("default_branch") or "main",
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
     result = run_gh_command(
         [
             "repo",
@@ -173,8 +426,8 @@ def get_repo_info(owner: str, repo: str) -> Optional[Repository]:
         return None
 
     try:
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError:
+        data = _json_loads(result.stdout)
+    except ValueError:
         return None
 
     default_branch = "main"
@@ -195,15 +448,29 @@ def get_repo_info(owner: str, repo: str) -> Optional[Repository]:
 
 def check_user_org_access(org: str) -> bool:
     """Check if user has access to transfer repos in an organization."""
+    client = get_client()
+    if client is not None:
+        response = client.get(f"/user/memberships/orgs/{org}")
+        if response is not None and response.status_code == 200:
+            return True
+        # Fall back to checking if it's the user's own account
+        response = client.get("/user")
+        if response is not None and response.status_code == 200:
+            try:
+                return response.json().get("login") == org
+            except ValueError:
+                pass
+        return False
+
     result = run_gh_command(["api", f"/orgs/{org}/memberships/${{user}}"])
     if result.returncode != 0:
         # Try checking if it's the user's own account
         result = run_gh_command(["api", "/user"])
         if result.returncode == 0:
             try:
-                user_data = json.loads(result.stdout)
+                user_data = _json_loads(result.stdout)
                 return user_data.get("login") == org
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return False
     return True
@@ -1,24 +1,97 @@
 """Shared utilities for github-org-mirror."""
 
+import configparser
+import functools
 import os
+import shutil
+import stat
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
-from rich.console import Console
-
-console = Console()
+from .gh_api import check_auth
 
 
 def is_git_repo(path: Path) -> bool:
-    """Check if a directory is a git repository."""
-    return (path / ".git").is_dir()
+    """Check if a directory is a git repository.
 
+    One stat syscall with no intermediate Path objects — this runs once
+    per entry when scanning thousands of repos.
+    """
+    try:
+        st = os.stat(os.path.join(os.fspath(path), ".git"), follow_symlinks=False)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode)
 
-def get_repo_remote_url(path: Path) -> Optional[str]:
-    """Get the origin remote URL for a git repository."""
-    if not is_git_repo(path):
+
+def _read_origin_from_config(path: Path) -> Optional[str]:
+    """Read the origin URL straight from .git/config, without spawning git.
+
+    Returns None when the file is missing or does not parse as plain INI
+    (e.g. worktree .git pointer files), in which case callers should fall
+    back to the git subprocess.
+    """
+    config_file = os.path.join(os.fspath(path), ".git", "config")
+    parser = configparser.ConfigParser(strict=False)
+    try:
+        if not parser.read(config_file):
+            return None
+    except (configparser.Error, UnicodeDecodeError, OSError):
         return None
+    return parser.get('remote "origin"', "url", fallback=None)
+
+
+def _write_origin_to_config(path: Path, url: str) -> bool:
+    """Rewrite the origin URL in .git/config in place, atomically.
+
+    Edits only the url line inside [remote "origin"], preserving the
+    rest of the file byte for byte. Returns False when the section or
+    key cannot be located, so callers can fall back to git.
+    """
+    config_file = os.path.join(os.fspath(path), ".git", "config")
+    try:
+        with open(config_file) as f:
+            lines = f.readlines()
+    except OSError:
+        return False
+
+    in_origin = False
+    url_line = None
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("["):
+            in_origin = stripped == '[remote "origin"]'
+        elif in_origin and stripped.startswith("url") and "=" in stripped:
+            url_line = i
+            break
+    if url_line is None:
+        return False
+
+    indent = lines[url_line][: len(lines[url_line]) - len(lines[url_line].lstrip())]
+    lines[url_line] = f"{indent}url = {url}\n"
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(config_file), prefix="config.")
+        with os.fdopen(fd, "w") as f:
+            f.writelines(lines)
+        # mkstemp creates 0600; keep the original mode (e.g. group-
+        # readable repos under core.sharedRepository)
+        shutil.copymode(config_file, tmp_path)
+        os.replace(tmp_path, config_file)
+    except OSError:
+        return False
+    return True
+
+
+def _read_remote_url(path: Path, fast_path: bool) -> Optional[str]:
+    """Read the origin URL, trying .git/config before spawning git."""
+    if fast_path:
+        url = _read_origin_from_config(path)
+        if url is not None:
+            return url
     try:
         result = subprocess.run(
             ["git", "-C", str(path), "remote", "get-url", "origin"],
@@ -31,10 +104,36 @@ def get_repo_remote_url(path: Path) -> Optional[str]:
         return None
 
 
-def set_repo_remote_url(path: Path, url: str) -> bool:
+@functools.lru_cache(maxsize=4096)
+def _remote_url_cached(path_str: str, mtime_ns: int, fast_path: bool) -> Optional[str]:
+    """Memoized remote lookup; mtime_ns keys out stale entries."""
+    return _read_remote_url(Path(path_str), fast_path)
+
+
+def get_repo_remote_url(path: Path, fast_path: bool = True) -> Optional[str]:
+    """Get the origin remote URL for a git repository.
+
+    Repeated lookups are memoized on .git/config's mtime, which changes
+    whenever the remote is rewritten.
+    """
+    config_file = os.path.join(os.fspath(path), ".git", "config")
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
+        # No plain .git/config (missing repo, or a worktree pointer
+        # file) — resolve uncached
+        if not is_git_repo(path):
+            return None
+        return _read_remote_url(path, fast_path)
+    return _remote_url_cached(os.fspath(path), mtime_ns, fast_path)
+
+
+def set_repo_remote_url(path: Path, url: str, fast_path: bool = True) -> bool:
     """Set the origin remote URL for a git repository."""
     if not is_git_repo(path):
         return False
+    if fast_path and _write_origin_to_config(path, url):
+        return True
     try:
         subprocess.run(
             ["git", "-C", str(path), "remote", "set-url", "origin", url],
@@ -47,33 +146,45 @@ def set_repo_remote_url(path: Path, url: str) -> bool:
 
 
 def parse_github_remote(url: str) -> Optional[Tuple[str, str]]:
-    """Parse a GitHub remote URL and return (owner, repo) tuple."""
-    # Handle SSH format: git@github.com:owner/repo.git
+    """Parse a GitHub remote URL and return (owner, repo) tuple.
+
+    A hand-rolled scan over the two known URL shapes — partition slices
+    at the first delimiter without regex machinery or per-segment lists.
+    The SSH form dominates and is checked first.
+    """
     if url.startswith("git@github.com:"):
-        path = url[15:]  # Remove 'git@github.com:'
-        if path.endswith(".git"):
-            path = path[:-4]
-        parts = path.split("/")
-        if len(parts) == 2:
-            return parts[0], parts[1]
+        rest = url[15:]
+    else:
+        scheme, sep, tail = url.partition("://")
+        if not sep or scheme not in ("https", "http", "ssh", "git"):
+            return None
+        # Drop a user[:pass]@ userinfo segment — token-authenticated
+        # HTTPS clones and ssh:// remotes carry one before the host
+        at = tail.find("@")
+        if at != -1 and at < tail.find("/"):
+            tail = tail[at + 1:]
+        if not tail.startswith("github.com/"):
+            return None
+        rest = tail[11:]
+    if rest.endswith("/"):
+        rest = rest[:-1]
+    if rest.endswith(".git"):
+        rest = rest[:-4]
+    owner, sep, repo = rest.partition("/")
+    if not sep or not owner or not repo or "/" in repo:
+        return None
+    return owner, repo
 
-    # Handle HTTPS format: https://github.com/owner/repo.git
-    if "github.com/" in url:
-        path = url.split("github.com/")[1]
-        if path.endswith(".git"):
-            path = path[:-4]
-        parts = path.split("/")
-        if len(parts) >= 2:
-            return parts[0], parts[1]
 
-    return None
+# Same templates Config._url_template binds; module constants so bulk
+# loops producing thousands of URLs reuse one template object
+_SSH_TMPL = "git@github.com:{}/{}.git"
+_HTTPS_TMPL = "https://github.com/{}/{}.git"
 
 
 def build_github_url(owner: str, repo: str, protocol: str = "ssh") -> str:
     """Build a GitHub URL for cloning."""
-    if protocol == "ssh":
-        return f"git@github.com:{owner}/{repo}.git"
-    return f"https://github.com/{owner}/{repo}.git"
+    return (_SSH_TMPL if protocol == "ssh" else _HTTPS_TMPL).format(owner, repo)
 
 
 def run_gh_command(args: list, capture_output: bool = True) -> subprocess.CompletedProcess:
@@ -82,27 +193,69 @@ def run_gh_command(args: list, capture_output: bool = True) -> subprocess.Comple
     return subprocess.run(cmd, capture_output=capture_output, text=True)
 
 
+@functools.lru_cache(maxsize=1)
 def check_gh_auth() -> bool:
-    """Check if GitHub CLI is authenticated."""
+    """Check if GitHub CLI is authenticated.
+
+    Cached for the process lifetime — auth state does not change
+    mid-invocation. Prefers one request on the pooled API client over
+    spawning a gh process.
+    """
+    direct = check_auth()
+    if direct is not None:
+        return direct
     result = run_gh_command(["auth", "status"])
     return result.returncode == 0
 
 
+# Decided once: styled output only makes sense on an interactive
+# terminal, and NO_COLOR opts out of it everywhere
+_USE_RICH = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Build the shared Console on first use.
+
+    Importing rich costs tens of milliseconds; subcommands that never
+    print through these helpers should not pay for it at startup.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _print_styled(message: str, style: str) -> None:
+    """Print a styled line without running Rich's markup parser.
+
+    A Text object carries its style directly, so the per-call markup
+    tokenizer never runs (and bracketed repo names print literally).
+    Off a TTY the message goes straight to stdout unstyled, bypassing
+    Rich entirely.
+    """
+    if _USE_RICH:
+        from rich.text import Text
+
+        _console().print(Text(message, style=style))
+    else:
+        sys.stdout.write(message + "\n")
+
+
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]{message}[/green]")
+    _print_styled(message, "green")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]{message}[/red]")
+    _print_styled(message, "red")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]{message}[/yellow]")
+    _print_styled(message, "yellow")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[blue]{message}[/blue]")
+    _print_styled(message, "blue")
@@ -1,17 +1,18 @@
 """File system watcher for detecting repo moves between org folders."""
 
+import os
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Optional, Set
+from typing import Callable, Dict, Optional, Tuple
 
-from watchdog.events import DirMovedEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+from cachetools import TTLCache
 
 from .config import Config
-from .transfer import transfer_repo, wait_for_transfer
+from .transfer import transfer_repo, wait_for_transfer_tracked
 from .utils import (
-    build_github_url,
     is_git_repo,
     parse_github_remote,
     get_repo_remote_url,
@@ -23,46 +24,178 @@ from .utils import (
 )
 
 
-class OrgMoveHandler(FileSystemEventHandler):
-    """Handles directory move events between organization folders."""
+class OrgMoveHandler:
+    """Handles directory move events between organization folders.
 
-    def __init__(self, config: Config, on_transfer: Optional[Callable] = None):
-        super().__init__()
+    Implements watchdog's handler contract (a dispatch method) directly
+    rather than subclassing FileSystemEventHandler, keeping watchdog out
+    of the module import graph — CLI commands that never watch skip its
+    import cost entirely.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        on_transfer: Optional[Callable] = None,
+        on_new_org_dir: Optional[Callable] = None,
+    ):
         self.config = config
         self.on_transfer = on_transfer
-        self.pending_moves: Dict[str, float] = {}
-        self.processed_moves: Set[str] = set()
+        self.on_new_org_dir = on_new_org_dir
+        # Event handling does path math per event; plain string prefix
+        # tests avoid allocating PurePath parts tuples in the hot path
+        self._base_prefix = os.fspath(config.base_path).rstrip(os.sep) + os.sep
+        # Org folder paths recur on every event; join each org once
+        self._org_paths: Dict[str, str] = {}
         self._lock = threading.Lock()
         # Debounce time to handle rapid successive events
         self.debounce_seconds = 2.0
+        # TTL caches stay bounded over long watcher uptimes without
+        # hand-rolled sweeps — stale entries fall out on their own
+        self.pending_moves: TTLCache = TTLCache(
+            maxsize=10_000, ttl=self.debounce_seconds * 4
+        )
+        self.processed_moves: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+        # Bounded pool: a mass reorganization should not spawn a thread
+        # (and a burst of API calls) per moved folder
+        self._pool = ThreadPoolExecutor(
+            max_workers=config.max_transfer_workers,
+            thread_name_prefix="org-move",
+        )
+        # Raw events land on a queue; one consumer sleeps out the burst,
+        # drains it, and dispatches only the final state per destination.
+        # A GUI drag can emit dozens of intermediate events per folder.
+        self._events = queue.Queue()
+        self._stop = threading.Event()
+        self._debounce_thread = threading.Thread(
+            target=self._debounce_loop,
+            name="org-move-debounce",
+            daemon=True,
+        )
+        self._debounce_thread.start()
+
+    def shutdown(self) -> None:
+        """Stop accepting moves and let in-flight transfers finish."""
+        self._stop.set()
+        self._pool.shutdown(wait=False)
+
+    def _debounce_loop(self) -> None:
+        """Coalesce bursts of move events and dispatch the survivors."""
+        # With one non-recursive watch per org folder, a move across orgs
+        # surfaces as a delete under one watch and a create under another,
+        # and the two emitters deliver their halves independently — so
+        # unpaired halves are kept across iterations until they match or
+        # expire.
+        pending_deleted: Dict[str, Tuple[Path, float]] = {}
+        pending_created: Dict[str, Tuple[Path, float]] = {}
+
+        while not self._stop.is_set():
+            try:
+                items = [self._events.get(timeout=1.0)]
+                # Let the burst finish, then drain whatever else arrived
+                self._stop.wait(self.debounce_seconds)
+                while True:
+                    try:
+                        items.append(self._events.get_nowait())
+                    except queue.Empty:
+                        break
+            except queue.Empty:
+                items = []
+                if not pending_deleted and not pending_created:
+                    continue
+
+            now = time.monotonic()
+            moves = []
+            for kind, src_path, dest_path in items:
+                if kind == "moved":
+                    moves.append((src_path, dest_path))
+                elif kind == "deleted":
+                    pending_deleted[src_path.name] = (src_path, now)
+                else:
+                    pending_created[dest_path.name] = (dest_path, now)
+
+            # Pair cross-watch halves by folder name
+            for name in list(pending_created):
+                if name in pending_deleted:
+                    dest_path = pending_created.pop(name)[0]
+                    src_path = pending_deleted.pop(name)[0]
+                    if src_path.parent != dest_path.parent:
+                        moves.append((src_path, dest_path))
+
+            # Drop halves that never found a partner (plain deletions,
+            # fresh clones, and so on)
+            cutoff = now - 4 * self.debounce_seconds
+            for pending in (pending_deleted, pending_created):
+                for name in [n for n, (_, ts) in pending.items() if ts < cutoff]:
+                    del pending[name]
+
+            # Last write wins per destination path
+            batch = {dest_path: src_path for src_path, dest_path in moves}
+            for dest_path, src_path in batch.items():
+                self._dispatch_move(src_path, dest_path)
 
     def _get_org_from_path(self, path: Path) -> Optional[str]:
         """Extract organization name from a path under base_path."""
-        try:
-            rel_path = path.relative_to(self.config.base_path)
-            parts = rel_path.parts
-            if parts:
-                return parts[0]
-        except ValueError:
-            pass
-        return None
-
-    def _is_direct_child(self, path: Path, parent: Path) -> bool:
+        p = os.fspath(path)
+        if not p.startswith(self._base_prefix):
+            return None
+        rest = p[len(self._base_prefix):].rstrip(os.sep)
+        if not rest:
+            return None
+        slash = rest.find(os.sep)
+        return rest[:slash] if slash >= 0 else rest
+
+    def _org_path_str(self, org: str) -> str:
+        """Get the org folder path string, cached per org."""
+        path = self._org_paths.get(org)
+        if path is None:
+            path = self._org_paths.setdefault(org, self.config.get_org_path_str(org))
+        return path
+
+    def _is_direct_child(self, path: Path, parent: str) -> bool:
         """Check if path is a direct child of parent (one level deep)."""
-        try:
-            rel_path = path.relative_to(parent)
-            return len(rel_path.parts) == 1
-        except ValueError:
+        p = os.fspath(path)
+        prefix = parent if parent.endswith(os.sep) else parent + os.sep
+        if not p.startswith(prefix):
             return False
+        rest = p[len(prefix):].rstrip(os.sep)
+        return bool(rest) and os.sep not in rest
+
+    def dispatch(self, event):
+        """Route a raw watchdog event; only directory events matter here."""
+        if not event.is_directory:
+            return
+        event_type = event.event_type
+        if event_type == "moved":
+            self.on_moved(event)
+        elif event_type == "created":
+            self.on_created(event)
+        elif event_type == "deleted":
+            self.on_deleted(event)
 
     def on_moved(self, event):
-        """Handle directory moved events."""
-        if not isinstance(event, DirMovedEvent):
+        """Queue directory moved events for debounced processing."""
+        self._events.put(("moved", Path(event.src_path), Path(event.dest_path)))
+
+    def on_created(self, event):
+        """Track directory creations for cross-watch move pairing."""
+        path = Path(event.src_path)
+        if path.parent == self.config.base_path:
+            # A new org-level folder: let the watcher start watching it
+            if self.on_new_org_dir:
+                self.on_new_org_dir(path)
             return
+        self._events.put(("created", None, path))
 
-        src_path = Path(event.src_path)
-        dest_path = Path(event.dest_path)
+    def on_deleted(self, event):
+        """Track directory deletions for cross-watch move pairing."""
+        path = Path(event.src_path)
+        if path.parent == self.config.base_path:
+            return
+        self._events.put(("deleted", path, None))
 
+    def _dispatch_move(self, src_path: Path, dest_path: Path) -> None:
+        """Validate a coalesced move and hand it to the transfer pool."""
         # Only process moves that are direct children of org folders
         # (i.e., repo-level moves, not nested directories)
         src_org = self._get_org_from_path(src_path)
@@ -72,12 +205,9 @@ class OrgMoveHandler(FileSystemEventHandler):
             return
 
         # Check if this is a repo-level move (direct child of org folder)
-        src_org_path = self.config.base_path / src_org
-        dest_org_path = self.config.base_path / dest_org
-
-        if not self._is_direct_child(src_path, src_org_path):
+        if not self._is_direct_child(src_path, self._org_path_str(src_org)):
             return
-        if not self._is_direct_child(dest_path, dest_org_path):
+        if not self._is_direct_child(dest_path, self._org_path_str(dest_org)):
             return
 
         # Same org, just a rename within the org - ignore
@@ -90,22 +220,19 @@ class OrgMoveHandler(FileSystemEventHandler):
             print_warning(f"Moved folder is not a git repo: {dest_path}")
             return
 
-        # Debounce - avoid processing the same move multiple times
+        # Debounce - avoid processing the same move multiple times.
+        # A TTLCache read can evict expired entries, so even the lookup
+        # mutates shared state; the whole check-then-set stays locked.
         move_key = f"{src_path}:{dest_path}"
+        now = time.monotonic()
         with self._lock:
-            now = time.time()
-            if move_key in self.pending_moves:
-                if now - self.pending_moves[move_key] < self.debounce_seconds:
-                    return
+            prev = self.pending_moves.get(move_key)
+            if prev is not None and now - prev < self.debounce_seconds:
+                return
             self.pending_moves[move_key] = now
 
-        # Process the move in a separate thread to avoid blocking
-        thread = threading.Thread(
-            target=self._process_move,
-            args=(src_org, dest_org, src_path, dest_path),
-            daemon=True,
-        )
-        thread.start()
+        # Process the move off the event thread to avoid blocking
+        self._pool.submit(self._process_move, src_org, dest_org, src_path, dest_path)
 
     def _process_move(
         self, src_org: str, dest_org: str, src_path: Path, dest_path: Path
@@ -138,11 +265,12 @@ class OrgMoveHandler(FileSystemEventHandler):
 
         # Initiate the transfer
         if transfer_repo(src_org, repo, dest_org):
-            # Wait for transfer to complete
-            if wait_for_transfer(dest_org, repo, timeout=120):
+            # Wait for transfer to complete; concurrent moves share one
+            # batched poll loop rather than each polling the API
+            if wait_for_transfer_tracked(dest_org, repo, timeout=120):
                 # Update local remote URL
                 if self.config.auto_update_remotes:
-                    new_url = build_github_url(dest_org, repo, self.config.clone_protocol)
+                    new_url = self.config.url_for(dest_org, repo)
                     if set_repo_remote_url(dest_path, new_url):
                         print_success(f"Updated remote URL to {new_url}")
                     else:
@@ -163,11 +291,17 @@ class RepoWatcher:
     def __init__(self, config: Config, on_transfer: Optional[Callable] = None):
         self.config = config
         self.on_transfer = on_transfer
-        self.observer: Optional[Observer] = None
+        self.observer = None
+        self._handler: Optional[OrgMoveHandler] = None
         self._running = False
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
         """Start watching for repository moves."""
+        # Deferred: watchdog spins up platform notification machinery on
+        # import, and only this subcommand needs it
+        from watchdog.observers import Observer
+
         if self._running:
             print_warning("Watcher is already running")
             return
@@ -176,21 +310,37 @@ class RepoWatcher:
             print_error(f"Base path does not exist: {self.config.base_path}")
             return
 
-        handler = OrgMoveHandler(self.config, self.on_transfer)
+        handler = OrgMoveHandler(self.config, self.on_transfer, on_new_org_dir=self._watch_dir)
+        self._handler = handler
         self.observer = Observer()
-        self.observer.schedule(handler, str(self.config.base_path), recursive=True)
+        # One non-recursive watch per org folder (plus the base, to spot
+        # new org folders) instead of a recursive descent into every
+        # repo: O(#orgs) kernel watches rather than O(total files).
+        self.observer.schedule(handler, str(self.config.base_path), recursive=False)
+        for entry in self.config.base_path.iterdir():
+            if entry.is_dir():
+                self.observer.schedule(handler, str(entry), recursive=False)
         self.observer.start()
         self._running = True
 
         print_success(f"Watching for repo moves in: {self.config.base_path}")
         print_info("Move a repo folder between org directories to trigger a transfer")
 
+    def _watch_dir(self, path: Path) -> None:
+        """Schedule a watch for an org folder created after startup."""
+        if self.observer and self._handler:
+            self.observer.schedule(self._handler, str(path), recursive=False)
+
     def stop(self) -> None:
         """Stop watching."""
+        self._stop_event.set()
         if self.observer:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+        if self._handler:
+            self._handler.shutdown()
+            self._handler = None
         self._running = False
         print_info("Watcher stopped")
 
@@ -198,8 +348,10 @@ class RepoWatcher:
         """Run the watcher until interrupted."""
         self.start()
         try:
-            while self._running:
-                time.sleep(1)
+            # Block on the stop event rather than polling _running once
+            # a second — the main thread stays parked until stop() or ^C
+            if self._running:
+                self._stop_event.wait()
         except KeyboardInterrupt:
             print_info("\nReceived interrupt signal")
         finally: